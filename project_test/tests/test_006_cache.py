@@ -0,0 +1,128 @@
+import pytest
+
+from rstview.cache import (LRURenderCache, DjangoRenderCache,
+                           get_render_cache, make_cache_key)
+from rstview.parser import RstBasicRenderer, RstExtendedRenderer
+
+
+def test_cache_key_stable():
+    """Same parts always give the same key, different parts a different one"""
+    assert make_cache_key("foo", {'a': 1}, True) == make_cache_key("foo", {'a': 1}, True)
+    assert make_cache_key("foo", True) != make_cache_key("foo", False)
+    assert make_cache_key("ab", "c") != make_cache_key("a", "bc")
+
+
+def test_lru_max_entries():
+    """Least recently used entries are evicted first"""
+    cache = LRURenderCache(max_entries=2)
+    cache.set('a', "A")
+    cache.set('b', "B")
+    # Touch 'a' so 'b' is the least recently used
+    assert cache.get('a') == "A"
+    cache.set('c', "C")
+
+    assert len(cache) == 2
+    assert cache.get('b') is None
+    assert cache.get('a') == "A"
+    assert cache.get('c') == "C"
+
+
+def test_lru_max_size():
+    """Entries are evicted when contents size exceed limit"""
+    cache = LRURenderCache(max_entries=None, max_size=10)
+    cache.set('a', "12345")
+    cache.set('b', "12345")
+    assert cache.size == 10
+
+    cache.set('c', "123")
+    assert cache.get('a') is None
+    assert cache.size == 8
+
+    # Too big to be stored at all
+    cache.set('d', "12345678901")
+    assert cache.get('d') is None
+    assert cache.size == 8
+
+
+def test_renderer_cache_hit(settings):
+    """Cached render is returned without parsing again"""
+    source = """Lorem **ipsum** salace"""
+    cache = LRURenderCache()
+    renderer = RstBasicRenderer(cache=cache)
+
+    render = renderer.parse(source)
+    assert len(cache) == 1
+
+    key = renderer.get_cache_key(source, renderer.get_options('default'),
+                                 renderer.get_writer_option(), True)
+    cache.set(key, {'result': "cached"})
+
+    assert renderer.parse(source) == "cached"
+    # Other options make another key
+    assert renderer.parse(source, silent=True) == render
+    assert len(cache) == 2
+
+
+def test_renderer_cache_writer(settings):
+    """Writer is part of the cache key"""
+    source = """Lorem ``ipsum`` salace"""
+    cache = LRURenderCache()
+    renderer = RstBasicRenderer(cache=cache)
+
+    settings.RSTVIEW_PARSER_WRITER = "html5"
+    html5 = renderer.parse(source)
+    settings.RSTVIEW_PARSER_WRITER = "html4"
+    html4 = renderer.parse(source)
+
+    assert html5 != html4
+    assert len(cache) == 2
+
+
+def test_extended_cache_messages(settings, capsys):
+    """Messages are restored from cache so validation still works"""
+    source = """Lorem **ipsum salace"""
+    cache = LRURenderCache()
+
+    first = RstExtendedRenderer(cache=cache)
+    render = first.parse(source)
+
+    second = RstExtendedRenderer(cache=cache)
+    assert second.parse(source) == render
+    assert second.is_valid() == False
+    assert second.messages == [
+        (1, 2, 'Inline strong start-string without end-string.'),
+    ]
+
+    # Basic renderer does not share entries with extended one
+    RstBasicRenderer(cache=cache).parse(source)
+    assert len(cache) == 2
+
+
+def test_django_cache(settings):
+    """Render through a Django cache"""
+    source = """Lorem **ipsum salace"""
+    cache = DjangoRenderCache(key_prefix='rstview-tests')
+    cache.clear()
+
+    first = RstExtendedRenderer(cache=cache)
+    render = first.parse(source, body_only=False)
+
+    second = RstExtendedRenderer(cache=cache)
+    assert second.parse(source, body_only=False) == render
+    assert second.is_valid() == False
+
+
+def test_global_cache(settings):
+    """Global cache is built from settings"""
+    assert get_render_cache() is None
+    assert RstBasicRenderer().get_cache() is None
+
+    settings.RSTVIEW_RENDER_CACHE_BACKEND = "rstview.cache.LRURenderCache"
+    settings.RSTVIEW_RENDER_CACHE_OPTIONS = {'max_entries': 5}
+
+    cache = get_render_cache()
+    assert isinstance(cache, LRURenderCache)
+    assert cache.max_entries == 5
+    assert get_render_cache() is cache
+    assert RstBasicRenderer().get_cache() is cache
+    assert RstBasicRenderer(cache=False).get_cache() is None
@@ -0,0 +1,67 @@
+import threading
+
+from docutils import utils
+from docutils.utils import error_reporting
+
+from rstview.parser import RstExtendedRenderer
+
+
+def build_source(index):
+    """
+    Build a source with a valid paragraph for each thread index then an
+    invalid one, so every thread has a different message line
+    """
+    lines = ["Paragraph {}.\n".format(i) for i in range(index)]
+    lines.append("Lorem **ipsum salace")
+    return "\n".join(lines)
+
+
+def test_no_monkeypatch(settings):
+    """Parsing does not tamper docutils classes anymore"""
+    system_message = utils.Reporter.system_message
+    write = error_reporting.ErrorOutput.write
+
+    RstExtendedRenderer().parse("Lorem **ipsum salace")
+
+    assert utils.Reporter.system_message == system_message
+    assert error_reporting.ErrorOutput.write == write
+
+
+def test_concurrent_messages(settings, capsys):
+    """Concurrent renders each get exactly their own messages"""
+    thread_count = 12
+    iterations = 10
+    errors = []
+
+    def worker(index):
+        source = build_source(index)
+        attempted = [
+            (2 * index + 1, 2, 'Inline strong start-string without end-string.'),
+        ]
+        try:
+            for i in range(iterations):
+                renderer = RstExtendedRenderer()
+                renderer.parse(source)
+                if renderer.messages != attempted:
+                    errors.append((index, renderer.messages))
+                # Valid sources never get a message from other threads
+                renderer.parse("Paragraph {}.".format(index))
+                if renderer.messages != []:
+                    errors.append((index, renderer.messages))
+        except Exception as e:
+            errors.append((index, e))
+
+    threads = [threading.Thread(target=worker, args=(index,))
+               for index in range(thread_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    out, err = capsys.readouterr()
+
+    assert errors == []
+
+    # Ensure parser is totally silent
+    assert out == ""
+    assert err == ""
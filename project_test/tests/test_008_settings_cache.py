@@ -0,0 +1,95 @@
+from rstview.parser import (RstBasicRenderer, RstExtendedRenderer,
+                            SettingsCache)
+from rstview.registry import RstConfigSite, rstview_registry
+
+
+def test_settings_reused(settings):
+    """Resolved settings are built once then reused"""
+    renderer = RstBasicRenderer()
+    writer_option = renderer.get_writer_option()
+
+    first = renderer.get_settings('default', writer_option)
+    second = RstBasicRenderer().get_settings('default', writer_option)
+
+    assert first is second
+    assert first['settings'].initial_header_level == 3
+    assert first['settings'].halt_level == 6
+
+    # Options make a different settings object
+    silent = renderer.get_settings('default', writer_option, silent=True)
+    assert silent is not first
+    assert silent['settings'].report_level == 5
+
+    # Extended renderer has its own overrides
+    extended = RstExtendedRenderer().get_settings('default', writer_option)
+    assert extended is not first
+    assert extended['settings'].warning_stream is False
+
+
+def test_settings_writer(settings):
+    """Writer is part of settings key"""
+    renderer = RstBasicRenderer()
+
+    settings.RSTVIEW_PARSER_WRITER = "html5"
+    html5 = renderer.get_settings('default', renderer.get_writer_option())
+    settings.RSTVIEW_PARSER_WRITER = "html4"
+    html4 = renderer.get_settings('default', renderer.get_writer_option())
+
+    assert html5 is not html4
+
+
+def test_settings_security(settings):
+    """Security setting is part of settings key"""
+    renderer = RstBasicRenderer()
+    writer_option = renderer.get_writer_option()
+
+    settings.RSTVIEW_PARSER_SECURITY = {'halt_level': 5, 'enable_exit': 0}
+    resolved = renderer.get_settings('default', writer_option)
+
+    assert resolved['settings'].halt_level == 5
+
+
+def test_settings_registry_change(settings):
+    """Registry changes invalidate resolved settings"""
+    source = """Foo\n***\nLorem ipsum"""
+    renderer = RstBasicRenderer()
+
+    rstview_registry.register('settings_cache_test', {
+        'initial_header_level': 2,
+        'doctitle_xform': False,
+    })
+    try:
+        assert renderer.parse(source, setting_key='settings_cache_test') == (
+            """<section id="foo"><h2>Foo</h2>\n"""
+            """<p>Lorem ipsum</p>\n"""
+            """</section>"""
+        )
+
+        rstview_registry.update({
+            'settings_cache_test': {
+                'initial_header_level': 4,
+                'doctitle_xform': False,
+            },
+        })
+        assert renderer.parse(source, setting_key='settings_cache_test') == (
+            """<section id="foo"><h4>Foo</h4>\n"""
+            """<p>Lorem ipsum</p>\n"""
+            """</section>"""
+        )
+    finally:
+        rstview_registry.unregister('settings_cache_test')
+
+
+def test_settings_cache_revision():
+    """Settings cache is emptied on registry revision change"""
+    registry = RstConfigSite()
+    cache = SettingsCache(registry)
+
+    assert cache.get('foo', lambda: 1) == 1
+    assert cache.get('foo', lambda: 2) == 1
+
+    registry.register('bar', {})
+    assert cache.get('foo', lambda: 3) == 3
+
+    registry.touch()
+    assert cache.get('foo', lambda: 4) == 4
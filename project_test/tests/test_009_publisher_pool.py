@@ -0,0 +1,97 @@
+import threading
+
+import pytest
+
+from docutils import nodes
+from docutils.parsers.rst import Directive, directives
+from docutils.utils import SystemMessage
+
+from rstview.parser import RstBasicRenderer, RstExtendedRenderer, publisher_pool
+
+
+class NestedRenderDirective(Directive):
+    """Directive which render its content with another renderer"""
+    has_content = True
+
+    def run(self):
+        html = RstBasicRenderer().parse(u'\n'.join(self.content))
+        return [nodes.raw('', html, format='html')]
+
+
+def test_publisher_reused(settings):
+    """Publisher is reused for every document in the same thread"""
+    publisher_pool.clear()
+    renderer = RstBasicRenderer()
+
+    renderer.parse("Lorem **ipsum** salace")
+    pooled = list(publisher_pool.publishers.values())
+    assert len(pooled) == 1
+    publisher = pooled[0][0]
+
+    assert renderer.parse("Foo *bar*") == "<p>Foo <em>bar</em></p>\n"
+    assert list(publisher_pool.publishers.values()) == [[publisher]]
+
+    # Nothing related to document is kept once done
+    assert publisher.document is None
+    assert publisher.settings is None
+    assert publisher.writer.parts == {}
+
+
+def test_parts_not_shared(settings):
+    """Returned parts are never mutated by the next document"""
+    renderer = RstBasicRenderer()
+
+    first = renderer.parse("Lorem **ipsum** salace", body_only=False)
+    second = renderer.parse("Foo *bar*", body_only=False)
+
+    assert first is not second
+    assert first['fragment'] == "<p>Lorem <strong>ipsum</strong> salace</p>\n"
+    assert second['fragment'] == "<p>Foo <em>bar</em></p>\n"
+
+
+def test_nested_render(settings):
+    """A render inside a render use another publisher"""
+    directives.register_directive('nestedrender', NestedRenderDirective)
+
+    source = ("Before\n\n"
+              ".. nestedrender::\n\n"
+              "    Inner **text**\n\n"
+              "After")
+
+    assert RstExtendedRenderer().parse(source, setting_key='full_page') == (
+        "<p>Before</p>\n"
+        "<p>Inner <strong>text</strong></p>\n"
+        "<p>After</p>\n"
+    )
+
+
+def test_failure_recovery(settings):
+    """A failing document does not break the pooled publisher"""
+    settings.RSTVIEW_PARSER_SECURITY = {'halt_level': 2, 'enable_exit': 0}
+    renderer = RstExtendedRenderer()
+
+    with pytest.raises(SystemMessage):
+        renderer.parse("Lorem **ipsum salace")
+
+    assert renderer.parse("Foo *bar*") == "<p>Foo <em>bar</em></p>\n"
+    assert renderer.is_valid() == True
+
+
+def test_thread_local_pool(settings):
+    """Every thread has its own publishers"""
+    publisher_pool.clear()
+    RstBasicRenderer().parse("Lorem ipsum")
+    main_publishers = dict(publisher_pool.publishers)
+    found = []
+
+    def worker():
+        found.append(dict(publisher_pool.publishers))
+        RstBasicRenderer().parse("Lorem ipsum")
+        found.append(dict(publisher_pool.publishers))
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+
+    assert found[0] == {}
+    assert list(found[1].values())[0] != list(main_publishers.values())[0]
@@ -0,0 +1,103 @@
+import os
+
+import pytest
+
+from rstview.cache import LRURenderCache
+from rstview.parser import RstBasicRenderer, RstExtendedRenderer
+
+
+@pytest.mark.parametrize("source_filename,output_filename,writer", [
+    ("basic/input.rst", "basic/output-html5.html", "html5"),
+    ("basic/input.rst", "basic/output-html4.html", "html4"),
+    ("advanced/input.rst", "advanced/output-html5.html", "html5"),
+    ("advanced/input.rst", "advanced/output-html4.html", "html4"),
+    ("invalid/input.rst", "invalid/output-html5.html", "html5"),
+    ("invalid/input.rst", "invalid/output-html4.html", "html4"),
+    ("invalid-2/input.rst", "invalid-2/output-html5.html", "html5"),
+    ("invalid-2/input.rst", "invalid-2/output-html4.html", "html4"),
+])
+def test_doctree_render(settings, storageparameters, source_filename,
+                        output_filename, writer):
+    """Render from a parsed doctree is the same than a direct render"""
+    input_filepath = os.path.join(storageparameters.fixtures_path, source_filename)
+    output_filepath = os.path.join(storageparameters.fixtures_path, output_filename)
+
+    with open(input_filepath, 'r') as fp:
+        source = fp.read()
+
+    with open(output_filepath, 'r') as fp:
+        attempted = fp.read()
+
+    document = RstBasicRenderer(doctree_cache=False).parse_doctree(source)
+
+    # Rendering twice checks the doctree is never modified from rendering
+    assert document.render(writer) == attempted
+    assert document.render(writer) == attempted
+
+
+def test_doctree_many_writers(settings):
+    """Same doctree rendered as fragment, full parts and text"""
+    source = """Foo\n***\n\nLorem **ipsum** salace"""
+
+    document = RstBasicRenderer().parse_doctree(source,
+                                                setting_key='full_page')
+
+    assert document.render('html5') == (
+        """<section id="foo"><h1>Foo</h1>\n"""
+        """<p>Lorem <strong>ipsum</strong> salace</p>\n"""
+        """</section>"""
+    )
+
+    parts = document.render('html4', body_only=False)
+    assert parts['fragment'] == (
+        """<div class="section" id="foo">\n<h1>Foo</h1>\n"""
+        """<p>Lorem <strong>ipsum</strong> salace</p>\n"""
+        """</div>\n"""
+    )
+    assert 'whole' in parts
+
+    assert document.astext() == "Foo\n\nLorem ipsum salace"
+
+
+def test_doctree_cache(settings):
+    """Parsed doctree is stored in cache and reused"""
+    source = """Lorem **ipsum** salace"""
+    cache = LRURenderCache()
+    renderer = RstBasicRenderer(doctree_cache=cache)
+
+    first = renderer.parse_doctree(source)
+    second = renderer.parse_doctree(source)
+
+    assert len(cache) == 1
+    assert first.doctree is second.doctree
+
+    # Other options make another doctree
+    renderer.parse_doctree(source, silent=True)
+    assert len(cache) == 2
+
+
+def test_doctree_messages(settings, capsys):
+    """Messages are collected while parsing doctree, even from cache"""
+    source = """Lorem **ipsum salace"""
+    cache = LRURenderCache()
+    attempted = [
+        (1, 2, 'Inline strong start-string without end-string.'),
+    ]
+
+    renderer = RstExtendedRenderer(doctree_cache=cache)
+    document = renderer.parse_doctree(source)
+    assert renderer.messages == attempted
+    assert document.messages == attempted
+
+    document.render('html5')
+    document.render('text')
+
+    other = RstExtendedRenderer(doctree_cache=cache)
+    assert other.parse_doctree(source).messages == attempted
+    assert other.is_valid() == False
+
+    out, err = capsys.readouterr()
+
+    # Ensure parser is totally silent
+    assert out == ""
+    assert err == ""
@@ -0,0 +1,83 @@
+import pytest
+
+from docutils.utils import SystemMessage
+
+from rstview.parser import (RenderedDocument, RstBasicRenderer,
+                            RstExtendedRenderer, render_many)
+from rstview.registry import rstview_registry
+
+
+def build_sources(count):
+    """Build sources where every third one is invalid"""
+    sources = []
+    for i in range(count):
+        if i % 3 == 0:
+            sources.append("Document {} **invalid".format(i))
+        else:
+            sources.append("Document {} **valid**".format(i))
+    return sources
+
+
+def test_render_many_inprocess(settings):
+    """Single worker render in current process"""
+    results = render_many(["Lorem **ipsum** salace", "Foo *bar"], workers=1)
+
+    assert results == [
+        RenderedDocument("<p>Lorem <strong>ipsum</strong> salace</p>\n", []),
+        RenderedDocument(
+            ("<p>Foo <a href=\"#id1\"><span class=\"problematic\" id=\"id2\">"
+             "*</span></a>bar</p>\n"),
+            [(1, 2, 'Inline emphasis start-string without end-string.')]
+        ),
+    ]
+
+
+@pytest.mark.parametrize("workers,chunksize", [
+    (2, None),
+    (3, 1),
+    (2, 10),
+])
+def test_render_many_pool(settings, workers, chunksize):
+    """Pool results are the same than direct renders, in input order"""
+    sources = build_sources(25)
+
+    results = render_many(sources, workers=workers, chunksize=chunksize)
+
+    assert len(results) == len(sources)
+    for source, result in zip(sources, results):
+        renderer = RstExtendedRenderer(cache=False)
+        assert result.output == renderer.parse(source)
+        assert result.messages == renderer.messages
+
+
+def test_render_many_options(settings):
+    """Options, renderer and registered configuration are used by workers"""
+    source = "Foo\n***\n\nLorem ipsum"
+
+    rstview_registry.register('render_many_test', {
+        'initial_header_level': 4,
+        'doctitle_xform': False,
+    })
+    try:
+        results = render_many([source, source], workers=2,
+                              setting_key='render_many_test',
+                              renderer_class=RstBasicRenderer,
+                              body_only=False)
+    finally:
+        rstview_registry.unregister('render_many_test')
+
+    for item in results:
+        assert item.output['fragment'] == (
+            """<section id="foo"><h4>Foo</h4>\n"""
+            """<p>Lorem ipsum</p>\n"""
+            """</section>"""
+        )
+        assert item.messages == []
+
+
+def test_render_many_error(settings):
+    """Failure from a worker is raised"""
+    settings.RSTVIEW_PARSER_SECURITY = {'halt_level': 2, 'enable_exit': 0}
+
+    with pytest.raises(SystemMessage):
+        render_many(build_sources(4), workers=2)
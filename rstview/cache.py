@@ -0,0 +1,322 @@
+# -*- coding: utf-8 -*-
+"""
+
+.. _cache-intro:
+
+Render cache
+============
+
+Rendering reStructuredText through **docutils** is expensive, so rendered
+contents may be stored in a cache to be reused for an identical source with
+identical options.
+
+A render cache is enabled with ``settings.RSTVIEW_RENDER_CACHE_BACKEND``
+which is a Python path to a cache backend class, its options are given from
+``settings.RSTVIEW_RENDER_CACHE_OPTIONS``.
+
+Two backends are available:
+
+* ``rstview.cache.LRURenderCache``: An in-process cache with a *Least
+  Recently Used* eviction on entry count and contents size;
+* ``rstview.cache.DjangoRenderCache``: Use a cache from the Django cache
+  framework, so it can be shared between multiple processes.
+
+Example:
+
+    .. sourcecode:: python
+
+        RSTVIEW_RENDER_CACHE_BACKEND = "rstview.cache.LRURenderCache"
+        RSTVIEW_RENDER_CACHE_OPTIONS = {
+            'max_entries': 500,
+            'max_size': 5 * 1024 * 1024,
+        }
+
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.utils.encoding import force_bytes
+from django.utils.module_loading import import_string
+
+
+def make_cache_key(*parts):
+    """
+    Build a content addressed key from given parts.
+
+    Arguments:
+        *parts: Any values with a stable ``repr()``, strings are hashed from
+            their content.
+
+    Returns:
+        string: A SHA1 hexadecimal digest.
+    """
+    digest = hashlib.sha1()
+    for part in parts:
+        if not isinstance(part, (bytes, type(u''))):
+            part = repr(part)
+        digest.update(force_bytes(part))
+        # Separator so consecutive parts can not be confused
+        digest.update(b'\x00')
+    return digest.hexdigest()
+
+
+def estimate_size(value):
+    """
+    Roughly estimate the size of a cached value from its string contents.
+
+    Arguments:
+        value (object): Value to measure, can be a string or a (possibly
+            nested) dict, list or tuple.
+
+    Returns:
+        int: Estimated size, mostly the sum of string lengths.
+    """
+    if isinstance(value, (bytes, type(u''))):
+        return len(value)
+    elif isinstance(value, dict):
+        return sum([estimate_size(k) + estimate_size(v)
+                    for k, v in value.items()])
+    elif isinstance(value, (list, tuple)):
+        return sum([estimate_size(item) for item in value])
+    return 1
+
+
+class BaseRenderCache(object):
+    """
+    Render cache interface, every backend must implement its methods.
+    """
+    def get(self, key):
+        """
+        Get a cached value.
+
+        Arguments:
+            key (string): Cache key.
+
+        Returns:
+            object: Cached value or ``None`` if not cached.
+        """
+        raise NotImplementedError
+
+    def set(self, key, value):
+        """
+        Store a value in cache.
+
+        Arguments:
+            key (string): Cache key.
+            value (object): Value to store.
+        """
+        raise NotImplementedError
+
+    def delete(self, key):
+        """
+        Remove a value from cache if any.
+
+        Arguments:
+            key (string): Cache key.
+        """
+        raise NotImplementedError
+
+    def clear(self):
+        """
+        Remove every cached values.
+        """
+        raise NotImplementedError
+
+
+class LRURenderCache(BaseRenderCache):
+    """
+    In-process cache with *Least Recently Used* eviction.
+
+    Least recently used entries are evicted when either the entry count or
+    the estimated contents size exceed their limit.
+
+    This cache is thread safe but not shared between processes.
+
+    Keyword Arguments:
+        max_entries (int): Maximum entry count. Default to ``1000``.
+        max_size (int): Maximum estimated size of all cached values (mostly
+            string lengths, see ``rstview.cache.estimate_size``). Default to
+            ``None`` for no size limit.
+    """
+    def __init__(self, max_entries=1000, max_size=None):
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            try:
+                value, size = self._entries.pop(key)
+            except KeyError:
+                return None
+            # Push it again to be the most recently used
+            self._entries[key] = (value, size)
+            return value
+
+    def set(self, key, value):
+        size = estimate_size(value)
+
+        # Never store something that could not fit at all
+        if self.max_size is not None and size > self.max_size:
+            self.delete(key)
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self.size -= self._entries.pop(key)[1]
+
+            self._entries[key] = (value, size)
+            self.size += size
+
+            self._evict()
+
+    def _evict(self):
+        """
+        Drop least recently used entries until limits are respected.
+
+        Must be called with lock acquired.
+        """
+        while self._entries and (
+            (self.max_entries is not None and
+             len(self._entries) > self.max_entries) or
+            (self.max_size is not None and self.size > self.max_size)
+        ):
+            key, (value, size) = self._entries.popitem(last=False)
+            self.size -= size
+
+    def delete(self, key):
+        with self._lock:
+            if key in self._entries:
+                self.size -= self._entries.pop(key)[1]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+
+class DjangoRenderCache(BaseRenderCache):
+    """
+    Cache backed by a cache from the Django cache framework.
+
+    Keyword Arguments:
+        alias (string): Django cache name from ``settings.CACHES``. Default
+            to ``default``.
+        timeout (int): Cache timeout in seconds. Default to the timeout of
+            the Django cache.
+        key_prefix (string): Prefix added to every keys. Default to
+            ``rstview``.
+    """
+    def __init__(self, alias='default', timeout=DEFAULT_TIMEOUT,
+                 key_prefix='rstview'):
+        self.alias = alias
+        self.timeout = timeout
+        self.key_prefix = key_prefix
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def make_key(self, key):
+        return '{}:{}'.format(self.key_prefix, key)
+
+    def get(self, key):
+        return self.cache.get(self.make_key(key))
+
+    def set(self, key, value):
+        self.cache.set(self.make_key(key), value, self.timeout)
+
+    def delete(self, key):
+        self.cache.delete(self.make_key(key))
+
+    def clear(self):
+        """
+        Django cache framework does not allow to only clear prefixed keys, so
+        this clear the whole Django cache.
+        """
+        self.cache.clear()
+
+
+def build_cache(backend, options=None):
+    """
+    Get a cache backend instance.
+
+    Arguments:
+        backend (string or object): Python path to a cache backend class or
+            directly the class itself.
+
+    Keyword Arguments:
+        options (dict): Keyword arguments to give to the backend.
+
+    Returns:
+        object: Cache backend instance.
+    """
+    if isinstance(backend, (str, type(u''))):
+        backend = import_string(backend)
+    return backend(**(options or {}))
+
+
+_render_cache = {
+    'signature': None,
+    'instance': None,
+}
+
+
+def get_render_cache():
+    """
+    Get the global render cache built from settings.
+
+    Cache instance is shared until the related settings change.
+
+    Returns:
+        object: Cache backend instance or ``None`` if disabled.
+    """
+    backend = settings.RSTVIEW_RENDER_CACHE_BACKEND
+    if not backend:
+        return None
+
+    signature = (backend, dict(settings.RSTVIEW_RENDER_CACHE_OPTIONS))
+    if _render_cache['signature'] != signature:
+        _render_cache['instance'] = build_cache(
+            backend,
+            settings.RSTVIEW_RENDER_CACHE_OPTIONS
+        )
+        _render_cache['signature'] = signature
+
+    return _render_cache['instance']
+
+
+_doctree_cache = {
+    'signature': None,
+    'instance': None,
+}
+
+
+def get_doctree_cache():
+    """
+    Get the global doctree cache built from settings.
+
+    Document trees are live objects so they are only stored in an in-process
+    ``rstview.cache.LRURenderCache``.
+
+    Returns:
+        object: Cache backend instance or ``None`` if disabled.
+    """
+    entries = settings.RSTVIEW_DOCTREE_CACHE_ENTRIES
+    if not entries:
+        return None
+
+    if _doctree_cache['signature'] != entries:
+        _doctree_cache['instance'] = LRURenderCache(max_entries=entries)
+        _doctree_cache['signature'] = entries
+
+    return _doctree_cache['instance']
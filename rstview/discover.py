@@ -78,6 +78,7 @@ def discover(module_path, filename=None):
     except:
         # Reset the model registry to the state before exception occured
         rstview_registry._registry = before_import_registry
+        rstview_registry.touch()
 
         # Only bubble up error if app have a configurations file, dont raise anything
         # if it lacks of if (unobtrusive way)
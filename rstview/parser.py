@@ -11,17 +11,25 @@ Note:
     need to load it from your code if you want to use Pygment to highlight code
     blocks.
 """
+import collections
 import copy
+import multiprocessing
+import threading
 
 from django.conf import settings
 from django.utils.encoding import smart_str
 
-from docutils import utils
-from docutils.utils import error_reporting
-from docutils.core import publish_parts
+from docutils import io, statemachine, utils, writers
+from docutils.core import Publisher
+from docutils.parsers import rst
+from docutils.parsers.rst import roles, states
+from docutils.readers import doctree, standalone
 
+from rstview.cache import (get_doctree_cache, get_render_cache,
+                           make_cache_key)
 from rstview.html5writer import SemanticHTML5Writer
 from rstview.registry import rstview_registry
+from rstview.textwriter import PlainTextWriter
 
 
 # Safely try to load and register directive if Pygments is installed
@@ -31,10 +39,293 @@ except ImportError:
     pass
 
 
-# Store some methods we may need to monkeypatch during parsing (sic), so we
-# mirror it to safely turn back to them.
-_original_docutils_system_message = utils.Reporter.system_message
-_original_docutils_output_write = error_reporting.ErrorOutput.write
+#: Available writer names for renderers.
+WRITERS = {
+    'html5': {
+        'writer_class': SemanticHTML5Writer,
+    },
+    'html4': {
+        'writer_name': "html4css1",
+    },
+    'text': {
+        'writer_class': PlainTextWriter,
+    },
+}
+
+
+def copy_doctree(document):
+    """
+    Copy a document tree so it can be processed again without to change the
+    original one.
+
+    Node mappings from document (ids, names, messages from transforms, etc..)
+    are copied along the tree, however settings, reporter and transformer are
+    shared since they are replaced when a document tree is rendered.
+
+    Args:
+        document (docutils.nodes.document): Document to copy.
+
+    Returns:
+        docutils.nodes.document: The copied document.
+    """
+    memo = {}
+    for shared in (document.settings, document.reporter,
+                   document.transformer):
+        memo[id(shared)] = shared
+
+    return copy.deepcopy(document, memo)
+
+
+class ParsedDocument(object):
+    """
+    A parsed document tree which can be rendered many times with different
+    writers without to be parsed again.
+
+    Args:
+        renderer (RstBasicRenderer): Renderer which parsed the document.
+        doctree (docutils.nodes.document): Parsed document tree, it must not
+            be modified since it may be shared from doctree cache.
+        setting_key (string): Configuration name used to parse.
+        options (dict): Keyword arguments used to parse.
+
+    Keyword Arguments:
+        messages (list): Reporter messages collected during parsing, only
+            filled from ``RstExtendedRenderer``.
+    """
+    def __init__(self, renderer, doctree, setting_key, options,
+                 messages=None):
+        self.renderer = renderer
+        self.doctree = doctree
+        self.setting_key = setting_key
+        self.options = options
+        self.messages = messages or []
+
+    def render(self, writer=None, body_only=True):
+        """
+        Render document with a writer.
+
+        Keyword Arguments:
+            writer (string or object): A writer name from
+                ``rstview.parser.WRITERS``, a **docutils** writer name or a
+                writer class. Default to the one from
+                ``settings.RSTVIEW_PARSER_WRITER``.
+            body_only (bool): Returned content mode, see
+                ``RstBasicRenderer.parse()``.
+
+        Returns:
+            string or dict: Rendered content or the dict of parts.
+        """
+        return self.renderer.render_doctree(
+            self.doctree,
+            setting_key=self.setting_key,
+            writer=writer,
+            body_only=body_only,
+            **self.options
+        )
+
+    def astext(self):
+        """
+        Render document as plain text.
+
+        Returns:
+            string: Document text.
+        """
+        return self.render(writer='text')
+
+
+class ObservedReader(standalone.Reader):
+    """
+    Standalone reader which attach an observer to the reporter of every
+    document it creates.
+
+    This is the way to collect reporter messages for a single document
+    without to tamper **docutils** classes, so it is safe to use from many
+    threads at once.
+
+    Keyword Arguments:
+        observer (callable): Function to receive every
+            ``docutils.nodes.system_message`` emitted by the document reporter.
+            Default to ``None`` for no observer, it can be changed between
+            documents.
+    """
+    def __init__(self, observer=None, *args, **kwargs):
+        standalone.Reader.__init__(self, *args, **kwargs)
+        self.observer = observer
+
+    def new_document(self):
+        document = standalone.Reader.new_document(self)
+        if self.observer is not None:
+            document.reporter.attach_observer(self.observer)
+        return document
+
+
+class PooledParser(rst.Parser):
+    """
+    reStructuredText parser which keeps its state machine between documents.
+
+    Building the state machine compiles every transitions of every states,
+    this is a large part of parsing a short source. State machine is made to
+    be run again (like **docutils** already do for nested state machines), so
+    it is only built again if a previous run failed or debug mode changed.
+    """
+    pooled_statemachine = None
+
+    def get_statemachine(self, debug):
+        """
+        Get the state machine to run, build it if needed.
+
+        Args:
+            debug (bool): Debug mode from document reporter.
+
+        Returns:
+            docutils.parsers.rst.states.RSTStateMachine: State machine.
+        """
+        machine = self.pooled_statemachine
+        # Forget it during run so a failure never let it half initialized
+        self.pooled_statemachine = None
+
+        if machine is None or machine.debug != debug:
+            machine = states.RSTStateMachine(
+                state_classes=self.state_classes,
+                initial_state=self.initial_state,
+                debug=debug
+            )
+        return machine
+
+    def parse(self, inputstring, document):
+        """
+        Parse `inputstring` and populate `document`, a document tree.
+
+        This follows ``docutils.parsers.rst.Parser.parse`` except for the
+        state machine.
+        """
+        self.setup_parse(inputstring, document)
+        self.statemachine = self.get_statemachine(
+            document.reporter.debug_flag
+        )
+        inputlines = statemachine.string2lines(
+            inputstring, tab_width=document.settings.tab_width,
+            convert_whitespace=True
+        )
+        self.statemachine.run(inputlines, document, inliner=self.inliner)
+        # Restore the "default" default role after parsing a document
+        if '' in roles._roles:
+            del roles._roles['']
+        self.finish_parse()
+
+        self.pooled_statemachine = self.statemachine
+
+
+class SettingsCache(object):
+    """
+    Store resolved **docutils** settings objects so they are built only once
+    per configuration.
+
+    Building settings involves a ``docutils.frontend.OptionParser`` and
+    reading configuration files which is costly compared to parsing a short
+    source. Every stored item is dropped as soon as the configuration
+    registry changes.
+
+    Args:
+        registry (rstview.registry.RstConfigSite): Registry which stored items
+            depend on.
+    """
+    def __init__(self, registry):
+        self.registry = registry
+        self.revision = registry.revision
+        self._items = {}
+        self._lock = threading.Lock()
+
+    def clear(self):
+        """
+        Drop every stored items.
+        """
+        with self._lock:
+            self._items = {}
+            self.revision = self.registry.revision
+
+    def get(self, key, builder):
+        """
+        Get item for given key, build it if not stored yet.
+
+        Args:
+            key (tuple): Hashable key.
+            builder (callable): Function to build the item if not stored.
+
+        Returns:
+            object: Stored item.
+        """
+        with self._lock:
+            if self.revision != self.registry.revision:
+                self._items = {}
+                self.revision = self.registry.revision
+            revision = self.revision
+            item = self._items.get(key)
+
+        if item is None:
+            item = builder()
+            with self._lock:
+                # Dont store anything built from an outdated registry
+                if revision == self.revision == self.registry.revision:
+                    self._items[key] = item
+
+        return item
+
+
+#: Resolved docutils settings for registered configurations.
+settings_cache = SettingsCache(rstview_registry)
+
+
+class PublisherPool(threading.local):
+    """
+    Keep warm **docutils** publishers with their reader, parser and writer so
+    they are not created again for every document.
+
+    Pool is local to each thread and publishers are stored per components
+    (reader class and writer), since everything depending from configuration
+    is in the settings object given for each document. Publishers use a
+    ``rstview.parser.PooledParser`` to keep their parser state machine warm. A publisher is
+    acquired for a single document at once, so a nested render (like from a
+    directive) just use another publisher.
+    """
+    def __init__(self):
+        self.publishers = {}
+
+    def acquire(self, key, builder):
+        """
+        Get an idle publisher for given key, build a new one if there is none.
+
+        Args:
+            key (tuple): Hashable key for publisher components.
+            builder (callable): Function to build a new publisher.
+
+        Returns:
+            docutils.core.Publisher: Publisher instance.
+        """
+        idle = self.publishers.get(key)
+        if idle:
+            return idle.pop()
+        return builder()
+
+    def release(self, key, publisher):
+        """
+        Give back a publisher to the pool once its document is done.
+
+        Args:
+            key (tuple): Hashable key for publisher components.
+            publisher (docutils.core.Publisher): Publisher instance.
+        """
+        self.publishers.setdefault(key, []).append(publisher)
+
+    def clear(self):
+        """
+        Drop every pooled publishers for the current thread.
+        """
+        self.publishers = {}
+
+
+#: Pooled publishers for renderers.
+publisher_pool = PublisherPool()
 
 
 class RstBasicRenderer(object):
@@ -47,6 +338,21 @@ class RstBasicRenderer(object):
     * Parser errors and warnings are inserted inside the rendered source;
     * Errors and warnings are pushed to the standard output;
 
+    Rendered contents are stored in the render cache if enabled (see
+    :ref:`cache-intro`).
+
+    Documents are processed with pooled publishers (see
+    ``rstview.parser.PublisherPool``) so reader, parser and writer are not
+    created again for each document.
+
+    Keyword Arguments:
+        cache (object): A render cache backend instance to use instead of the
+            global one from settings. Use ``False`` to disable cache for this
+            renderer. Default to ``None``.
+        doctree_cache (object): A cache backend instance to store parsed
+            document trees instead of the global one from settings. Use
+            ``False`` to disable it for this renderer. Default to ``None``.
+
     Example:
         .. sourcecode:: python
             :linenos:
@@ -56,8 +362,12 @@ class RstBasicRenderer(object):
             >>> renderer.parse("Lorem **ipsum** salace")
             <p>Lorem <strong>ipsum</strong> salace</p>
     """
+    #: Docutils reader class to use.
+    reader_class = standalone.Reader
+
     def __init__(self, *args, **kwargs):
-        pass
+        self.cache = kwargs.get('cache', None)
+        self.doctree_cache = kwargs.get('doctree_cache', None)
 
     def get_options(self, name, initial_header_level=None,
                     silent=settings.RSTVIEW_PARSER_SILENT):
@@ -92,22 +402,476 @@ class RstBasicRenderer(object):
         parser_settings.update(settings.RSTVIEW_PARSER_SECURITY)
         return parser_settings
 
-    def get_writer_option(self):
+    def get_writer_option(self, writer=None):
         """
         Get the writer option for parser config depending it's ``html4`` or
         ``html5``.
 
+        Keyword Arguments:
+            writer (string or object): A writer name from
+                ``rstview.parser.WRITERS``, a **docutils** writer name or a
+                writer class. Default to ``None`` to use the one from
+                ``settings.RSTVIEW_PARSER_WRITER``, where anything else than
+                ``html5`` means ``html4``.
+
         Returns:
             dict: A dict containing the right writer option name and value.
         """
-        if settings.RSTVIEW_PARSER_WRITER == 'html5':
+        if writer is None:
+            if settings.RSTVIEW_PARSER_WRITER == 'html5':
+                writer = 'html5'
+            else:
+                writer = 'html4'
+
+        if isinstance(writer, type):
             return {
-                'writer': SemanticHTML5Writer(),
+                'writer_class': writer,
             }
+        elif writer in WRITERS:
+            return dict(WRITERS[writer])
+
+        return {
+            'writer_name': writer,
+        }
+
+    def get_writer(self, writer_option):
+        """
+        Get a writer instance from given writer option.
+
+        Args:
+            writer_option (dict): Writer option from
+                ``RstBasicRenderer.get_writer_option()``, either a
+                ``writer_class``, a writer instance as ``writer`` or a
+                **docutils** writer name as ``writer_name``.
+
+        Returns:
+            docutils.writers.Writer: Writer instance.
+        """
+        if 'writer' in writer_option:
+            return writer_option['writer']
+        elif 'writer_class' in writer_option:
+            return writer_option['writer_class']()
+        return writers.get_writer_class(writer_option['writer_name'])()
+
+    def get_writer_name(self, writer_option):
+        """
+        Get an unique name for writer from given writer option.
+
+        Args:
+            writer_option (dict): Writer option from
+                ``RstBasicRenderer.get_writer_option()``.
+
+        Returns:
+            string: Writer name or Python path to its class.
+        """
+        if 'writer' in writer_option:
+            writer_class = writer_option['writer'].__class__
+        elif 'writer_class' in writer_option:
+            writer_class = writer_option['writer_class']
         else:
-            return {
-                'writer_name': "html4css1",
-            }
+            return writer_option['writer_name']
+
+        return '{}.{}'.format(writer_class.__module__, writer_class.__name__)
+
+    def get_settings_overrides(self):
+        """
+        Get **docutils** settings to enforce over configuration options.
+
+        Returns:
+            dict: Settings.
+        """
+        return {}
+
+    def build_settings(self, setting_key, writer_option, **kwargs):
+        """
+        Resolve configuration options to a **docutils** settings object.
+
+        Args:
+            setting_key (string): Configuration name from registered
+                configurations.
+            writer_option (dict): Writer option from
+                ``RstBasicRenderer.get_writer_option()``.
+            **kwargs: Arbitrary keyword arguments to give as options to
+                ``RstBasicRenderer.get_options()``.
+
+        Returns:
+            dict: Resolved ``options`` dict and the ``settings`` object.
+        """
+        options = self.get_options(setting_key, **kwargs)
+
+        defaults = dict(options, **self.get_settings_overrides())
+        # Propagate exceptions like docutils does when used programmatically
+        defaults.setdefault('traceback', True)
+
+        publisher = self.build_publisher(writer_option)
+
+        return {
+            'options': options,
+            'settings': publisher.get_settings(**defaults),
+        }
+
+    def get_settings(self, setting_key, writer_option, **kwargs):
+        """
+        Get the resolved **docutils** settings object for a configuration.
+
+        Settings are built once for every combination of configuration,
+        keyword arguments, ``settings.RSTVIEW_PARSER_SECURITY`` and writer,
+        then they are reused until the configuration registry changes.
+
+        Args:
+            setting_key (string): Configuration name from registered
+                configurations.
+            writer_option (dict): Writer option from
+                ``RstBasicRenderer.get_writer_option()``.
+            **kwargs: Arbitrary keyword arguments to give as options to
+                ``RstBasicRenderer.get_options()``.
+
+        Returns:
+            dict: Resolved ``options`` dict and the ``settings`` object. They
+            are shared so they must not be modified.
+        """
+        key = (
+            self.__class__,
+            setting_key,
+            tuple(sorted(kwargs.items())),
+            tuple(sorted(settings.RSTVIEW_PARSER_SECURITY.items())),
+            self.get_writer_name(writer_option),
+        )
+
+        return settings_cache.get(key, lambda: self.build_settings(
+            setting_key, writer_option, **kwargs
+        ))
+
+    def get_cache(self):
+        """
+        Get the render cache to use.
+
+        Returns:
+            object: Render cache backend instance given to renderer, else the
+            global one from settings. ``None`` if cache is disabled.
+        """
+        if self.cache is False:
+            return None
+        elif self.cache is not None:
+            return self.cache
+        return get_render_cache()
+
+    def get_cache_key(self, source, options, writer_option, body_only):
+        """
+        Build the render cache key from everything that changes the output.
+
+        Args:
+            source (string): reStructuredText source to parse.
+            options (dict): Options from ``RstBasicRenderer.get_options()``.
+            writer_option (dict): Writer option from
+                ``RstBasicRenderer.get_writer_option()``.
+            body_only (bool): Returned content mode.
+
+        Returns:
+            string: Cache key.
+        """
+        return make_cache_key(
+            '{}.{}'.format(self.__class__.__module__,
+                           self.__class__.__name__),
+            smart_str(source),
+            sorted(options.items()),
+            self.get_writer_name(writer_option),
+            body_only,
+        )
+
+    def dump_cached(self, result):
+        """
+        Build value to store in render cache.
+
+        Args:
+            result (string or dict): Parser result.
+
+        Returns:
+            dict: Value to store.
+        """
+        return {'result': result}
+
+    def load_cached(self, cached):
+        """
+        Restore renderer from a cached value.
+
+        Args:
+            cached (dict): Value from render cache.
+
+        Returns:
+            string or dict: Cached parser result.
+        """
+        result = cached['result']
+        # Dont let a caller tamper the cached dict
+        if isinstance(result, dict):
+            result = dict(result)
+        return result
+
+    def build_publisher(self, writer_option):
+        """
+        Build a new publisher with its components.
+
+        Args:
+            writer_option (dict): Writer option from
+                ``RstBasicRenderer.get_writer_option()``.
+
+        Returns:
+            docutils.core.Publisher: Publisher instance without settings.
+        """
+        publisher = Publisher(reader=self.reader_class(),
+                              parser=PooledParser(),
+                              writer=self.get_writer(writer_option),
+                              source_class=io.StringInput,
+                              destination_class=io.StringOutput)
+        publisher.set_components('standalone', 'restructuredtext', None)
+        return publisher
+
+    def build_doctree_publisher(self, writer_option):
+        """
+        Build a new publisher to render an already parsed document tree.
+
+        Args:
+            writer_option (dict): Writer option from
+                ``RstBasicRenderer.get_writer_option()``.
+
+        Returns:
+            docutils.core.Publisher: Publisher instance without settings.
+        """
+        return Publisher(reader=doctree.Reader(parser_name='null'),
+                         writer=self.get_writer(writer_option),
+                         source_class=io.DocTreeInput,
+                         destination_class=io.StringOutput)
+
+    def setup_publisher(self, publisher):
+        """
+        Prepare a pooled publisher before processing a document.
+
+        Args:
+            publisher (docutils.core.Publisher): Publisher instance.
+        """
+        pass
+
+    def reset_publisher(self, publisher):
+        """
+        Release everything related to the last processed document from a
+        pooled publisher.
+
+        Args:
+            publisher (docutils.core.Publisher): Publisher instance.
+        """
+        publisher.document = None
+        publisher.source = None
+        publisher.destination = None
+        publisher.settings = None
+
+        publisher.reader.document = None
+        publisher.reader.source = None
+        publisher.reader.input = None
+
+        if publisher.parser is not None:
+            publisher.parser.statemachine = None
+
+        publisher.writer.document = None
+        publisher.writer.destination = None
+        publisher.writer.output = None
+        # Returned parts must not be mutated from the next document
+        publisher.writer.parts = {}
+
+    def run_publisher(self, key, builder, source, docutils_settings,
+                      pooled=True):
+        """
+        Process a source with a publisher.
+
+        Args:
+            key (tuple): Publisher key in pool.
+            builder (callable): Function to build a new publisher.
+            source (object): Source to give to publisher.
+            docutils_settings (optparse.Values): Settings object from
+                ``RstBasicRenderer.get_settings()``.
+
+        Keyword Arguments:
+            pooled (bool): If ``False``, a new publisher is always built.
+
+        Returns:
+            tuple: Processed document and the dict of parts from writer.
+        """
+        if pooled:
+            publisher = publisher_pool.acquire(key, builder)
+        else:
+            publisher = builder()
+
+        try:
+            self.setup_publisher(publisher)
+            # Docutils may change some settings during processing
+            publisher.settings = copy.copy(docutils_settings)
+            publisher.set_source(source, None)
+            publisher.set_destination(None, None)
+            publisher.publish()
+            return publisher.document, publisher.writer.parts
+        finally:
+            self.reset_publisher(publisher)
+            if pooled:
+                publisher_pool.release(key, publisher)
+
+    def publish(self, source, docutils_settings, writer_option,
+                body_only=True):
+        """
+        Effectively parse and render source with **docutils**.
+
+        Args:
+            source (string): reStructuredText source to parse.
+            docutils_settings (optparse.Values): Settings object from
+                ``RstBasicRenderer.get_settings()``.
+            writer_option (dict): Writer option from
+                ``RstBasicRenderer.get_writer_option()``.
+
+        Keyword Arguments:
+            body_only (bool): Returned content mode, see
+                ``RstBasicRenderer.parse()``.
+
+        Returns:
+            string or dict: Rendered content or the dict of parts.
+        """
+        document, parts = self.run_publisher(
+            (self.reader_class, self.get_writer_name(writer_option)),
+            lambda: self.build_publisher(writer_option),
+            smart_str(source),
+            docutils_settings,
+            # A given writer instance is never pooled
+            pooled='writer' not in writer_option,
+        )
+
+        if body_only:
+            return parts['fragment']
+
+        return parts
+
+    def get_doctree_cache(self):
+        """
+        Get the doctree cache to use.
+
+        Returns:
+            object: Doctree cache backend instance given to renderer, else
+            the global one from settings. ``None`` if cache is disabled.
+        """
+        if self.doctree_cache is False:
+            return None
+        elif self.doctree_cache is not None:
+            return self.doctree_cache
+        return get_doctree_cache()
+
+    def parse_doctree(self, source, setting_key="default", **kwargs):
+        """
+        Parse reStructuredText source to a document tree which can be
+        rendered many times with different writers.
+
+        Document tree is made from parsing and every transforms from reader
+        and parser. Transforms from writers are applied when rendering.
+
+        Parsed document trees are stored in doctree cache if enabled.
+
+        Args:
+            source (string): reStructuredText source to parse.
+            **kwargs: Arbitrary keyword arguments to give as options to
+                ``RstBasicRenderer.get_options()``.
+
+        Keyword Arguments:
+            setting_key (string): Configuration name from registered
+                configurations.
+
+        Returns:
+            rstview.parser.ParsedDocument: Parsed document.
+        """
+        writer_option = self.get_writer_option('null')
+        resolved = self.get_settings(setting_key, writer_option, **kwargs)
+
+        cache = self.get_doctree_cache()
+        key = None
+        if cache is not None:
+            key = self.get_cache_key(source, resolved['options'],
+                                     writer_option, False)
+            cached = cache.get(key)
+            if cached is not None:
+                return self.load_cached_doctree(cached, setting_key, kwargs)
+
+        document, parts = self.run_publisher(
+            (self.reader_class, self.get_writer_name(writer_option)),
+            lambda: self.build_publisher(writer_option),
+            smart_str(source),
+            resolved['settings'],
+        )
+
+        cached = self.dump_cached_doctree(document)
+        if cache is not None:
+            cache.set(key, cached)
+
+        return self.load_cached_doctree(cached, setting_key, kwargs)
+
+    def dump_cached_doctree(self, document):
+        """
+        Build value to store in doctree cache.
+
+        Args:
+            document (docutils.nodes.document): Parsed document tree.
+
+        Returns:
+            dict: Value to store.
+        """
+        return {'doctree': document}
+
+    def load_cached_doctree(self, cached, setting_key, options):
+        """
+        Restore a parsed document from a cached value.
+
+        Args:
+            cached (dict): Value from doctree cache.
+            setting_key (string): Configuration name used to parse.
+            options (dict): Keyword arguments used to parse.
+
+        Returns:
+            rstview.parser.ParsedDocument: Parsed document.
+        """
+        return ParsedDocument(self, cached['doctree'], setting_key, options)
+
+    def render_doctree(self, document, setting_key="default", writer=None,
+                       body_only=True, **kwargs):
+        """
+        Render a parsed document tree with a writer.
+
+        Original document tree is not modified, rendering is done on a copy.
+
+        Args:
+            document (docutils.nodes.document): Document tree from
+                ``RstBasicRenderer.parse_doctree()``.
+            **kwargs: Arbitrary keyword arguments to give as options to
+                ``RstBasicRenderer.get_options()``.
+
+        Keyword Arguments:
+            setting_key (string): Configuration name from registered
+                configurations.
+            writer (string or object): Writer to use, see
+                ``RstBasicRenderer.get_writer_option()``.
+            body_only (bool): Returned content mode, see
+                ``RstBasicRenderer.parse()``.
+
+        Returns:
+            string or dict: Rendered content or the dict of parts.
+        """
+        writer_option = self.get_writer_option(writer)
+        resolved = self.get_settings(setting_key, writer_option, **kwargs)
+
+        rendered, parts = self.run_publisher(
+            (doctree.Reader, self.get_writer_name(writer_option)),
+            lambda: self.build_doctree_publisher(writer_option),
+            copy_doctree(document),
+            resolved['settings'],
+            pooled='writer' not in writer_option,
+        )
+
+        if body_only:
+            return parts['fragment']
+
+        return parts
 
     def parse(self, source, setting_key="default", body_only=True, **kwargs):
         """
@@ -131,20 +895,25 @@ class RstBasicRenderer(object):
             content as a string or a dict containing datas about parsing
             (rendered content, styles, messages, title, etc..).
         """
-        opts = {
-            'source': smart_str(source),
-            'settings_overrides': self.get_options(setting_key, **kwargs),
-        }
+        writer_option = self.get_writer_option()
+        resolved = self.get_settings(setting_key, writer_option, **kwargs)
 
-        # Switch between html4/html5 writer
-        opts.update(self.get_writer_option())
+        cache = self.get_cache()
+        if cache is None:
+            return self.publish(source, resolved['settings'], writer_option,
+                                body_only)
 
-        parts = publish_parts(**opts)
+        key = self.get_cache_key(source, resolved['options'], writer_option,
+                                 body_only)
+        cached = cache.get(key)
+        if cached is not None:
+            return self.load_cached(cached)
 
-        if body_only:
-            return parts['fragment']
+        result = self.publish(source, resolved['settings'], writer_option,
+                              body_only)
+        cache.set(key, self.dump_cached(result))
 
-        return parts
+        return result
 
 
 class RstExtendedRenderer(RstBasicRenderer):
@@ -156,8 +925,10 @@ class RstExtendedRenderer(RstBasicRenderer):
     * Parser can be used to validate markup out of rendered document;
     * Nothing is printed out on standard output;
 
-    **docutils** parser is a bit touchy to use programatically, so we need to
-    apply some monkey patchs before and after parsing.
+    Messages are collected from an observer attached to the reporter of each
+    parsed document, so many renderers can parse at the same time from
+    different threads. However a renderer instance keeps the messages from
+    its last parsing, so it should not be shared between threads.
 
     Example:
         .. sourcecode:: python
@@ -172,6 +943,12 @@ class RstExtendedRenderer(RstBasicRenderer):
             >>> rendered.get_messages()
             []
     """
+    reader_class = ObservedReader
+
+    def __init__(self, *args, **kwargs):
+        super(RstExtendedRenderer, self).__init__(*args, **kwargs)
+        self.messages = []
+
     def is_valid(self):
         """
         Only to be used after parsing
@@ -181,6 +958,84 @@ class RstExtendedRenderer(RstBasicRenderer):
         """
         return not(self.messages)
 
+    def dump_cached(self, result):
+        """
+        Build value to store in render cache, including the reporter
+        messages so validation is still available from a cached render.
+
+        Args:
+            result (string or dict): Parser result.
+
+        Returns:
+            dict: Value to store.
+        """
+        cached = super(RstExtendedRenderer, self).dump_cached(result)
+        cached['messages'] = list(self.messages)
+        return cached
+
+    def load_cached(self, cached):
+        """
+        Restore renderer from a cached value, including reporter messages.
+
+        Args:
+            cached (dict): Value from render cache.
+
+        Returns:
+            string or dict: Cached parser result.
+        """
+        self.messages = list(cached.get('messages', []))
+        return super(RstExtendedRenderer, self).load_cached(cached)
+
+    def dump_cached_doctree(self, document):
+        """
+        Build value to store in doctree cache, including the reporter
+        messages.
+
+        Args:
+            document (docutils.nodes.document): Parsed document tree.
+
+        Returns:
+            dict: Value to store.
+        """
+        cached = super(RstExtendedRenderer, self).dump_cached_doctree(document)
+        cached['messages'] = list(self.messages)
+        return cached
+
+    def load_cached_doctree(self, cached, setting_key, options):
+        """
+        Restore a parsed document from a cached value, including reporter
+        messages.
+
+        Args:
+            cached (dict): Value from doctree cache.
+            setting_key (string): Configuration name used to parse.
+            options (dict): Keyword arguments used to parse.
+
+        Returns:
+            rstview.parser.ParsedDocument: Parsed document.
+        """
+        self.messages = list(cached.get('messages', []))
+        parsed = super(RstExtendedRenderer, self).load_cached_doctree(
+            cached,
+            setting_key,
+            options
+        )
+        parsed.messages = list(self.messages)
+        return parsed
+
+    def parse_doctree(self, *args, **kwargs):
+        """
+        Parse reStructuredText source to a document tree and collect its
+        reporter messages.
+
+        Returns:
+            rstview.parser.ParsedDocument: Parsed document.
+        """
+        self.messages = []
+
+        return super(RstExtendedRenderer, self).parse_doctree(*args,
+                                                              **kwargs)
+
     def format_parsing_error(self, error):
         """
         Format error message datas to a message line.
@@ -200,13 +1055,61 @@ class RstExtendedRenderer(RstBasicRenderer):
             message=message
         )
 
+    def observe_message(self, message):
+        """
+        Reporter observer to store warnings and errors.
+
+        Args:
+            message (docutils.nodes.system_message): Message node emitted by
+                the reporter.
+        """
+        if message['level'] >= utils.Reporter.WARNING_LEVEL:
+            self.messages.append((
+                message.get('line', None),
+                message['level'],
+                message[0].astext() if len(message) else '',
+            ))
+
+    def setup_publisher(self, publisher):
+        """
+        Plug the message observer on publisher reader.
+
+        Args:
+            publisher (docutils.core.Publisher): Publisher instance.
+        """
+        publisher.reader.observer = self.observe_message
+
+    def reset_publisher(self, publisher):
+        """
+        Unplug the message observer from publisher reader then release
+        everything related to the last processed document.
+
+        Args:
+            publisher (docutils.core.Publisher): Publisher instance.
+        """
+        publisher.reader.observer = None
+        # Dont let a kept document tree refer to this renderer
+        if publisher.document is not None:
+            reporter = publisher.document.reporter
+            if self.observe_message in reporter.observers:
+                reporter.detach_observer(self.observe_message)
+        super(RstExtendedRenderer, self).reset_publisher(publisher)
+
+    def get_settings_overrides(self):
+        """
+        Get **docutils** settings to enforce over configuration options.
+
+        Returns:
+            dict: Settings to not write anything on standard output.
+        """
+        return {
+            'warning_stream': False,
+        }
+
     def parse(self, *args, **kwargs):
         """
         Proceed to parsing for validation
 
-        We apply *monkey patchs* on two **docutils** methods, parse source then
-        *unmonkey*.
-
         Everytime validation is processed, messages are reseted so it should
         be safe enough to use the RstExtendedRenderer instance for many
         documents.
@@ -223,41 +1126,7 @@ class RstExtendedRenderer(RstBasicRenderer):
         # Ensure the list is cleaned before each validation
         self.messages = []
 
-        def system_message(instance, level, message, *children, **kwargs):
-            # Instance original method else nodes are bugged
-            result = _original_docutils_system_message(instance, level,
-                                                       message, *children,
-                                                       **kwargs)
-            # Store any warnings/erros in a global list so they can be used out
-            # of rendered document
-            if level >= instance.WARNING_LEVEL:
-                self.messages.append((
-                    kwargs.get('line', None),
-                    level,
-                    message
-                ))
-
-            return result
-
-        def dummy_write(instance, data):
-            """
-            Don't write anything on output stream
-            """
-            pass
-
-        # Monkeypatch docutils for simple errors/warnings output support
-        utils.Reporter.system_message = system_message
-        # Monkeypatch docutils for real silent errors/warnings (no print on std
-        # output)
-        error_reporting.ErrorOutput.write = dummy_write
-
-        result = super(RstExtendedRenderer, self).parse(*args, **kwargs)
-
-        # Unmonkey
-        utils.Reporter.system_message = _original_docutils_system_message
-        error_reporting.ErrorOutput.write = _original_docutils_output_write
-
-        return result
+        return super(RstExtendedRenderer, self).parse(*args, **kwargs)
 
     def get_messages(self):
         """
@@ -269,6 +1138,125 @@ class RstExtendedRenderer(RstBasicRenderer):
         return map(self.format_parsing_error, self.messages)
 
 
+#: Result of a document rendered from ``rstview.parser.render_many()``.
+RenderedDocument = collections.namedtuple('RenderedDocument',
+                                          ['output', 'messages'])
+
+# Rendering options for the current process, filled by the pool initializer
+_batch_options = {}
+
+
+def init_render_worker(registry, batch_options):
+    """
+    Initialize a process from ``rstview.parser.render_many()`` pool.
+
+    Configuration registry is restored from the snapshot of the parent
+    process, so configurations registered at runtime are available even if
+    process has not been forked.
+
+    Args:
+        registry (dict): Configuration registry snapshot.
+        batch_options (dict): Rendering options, see
+            ``rstview.parser.render_document()``.
+    """
+    rstview_registry.reset()
+    rstview_registry.update(registry)
+
+    _batch_options.clear()
+    _batch_options.update(batch_options)
+
+
+def render_document(source, batch_options=None):
+    """
+    Render a single document from a batch.
+
+    Args:
+        source (string): reStructuredText source to parse and render.
+
+    Keyword Arguments:
+        batch_options (dict): Rendering options with items
+            ``renderer_class``, ``setting_key``, ``body_only`` and
+            ``options`` (keyword arguments for renderer ``parse()``). Default
+            to the ones from ``rstview.parser.init_render_worker()``.
+
+    Returns:
+        rstview.parser.RenderedDocument: Rendered document.
+    """
+    batch_options = batch_options or _batch_options
+
+    renderer = batch_options['renderer_class']()
+    output = renderer.parse(
+        source,
+        setting_key=batch_options['setting_key'],
+        body_only=batch_options['body_only'],
+        **batch_options['options']
+    )
+
+    return RenderedDocument(output, list(getattr(renderer, 'messages', [])))
+
+
+def render_many(sources, setting_key="default", workers=None, chunksize=None,
+                renderer_class=None, body_only=True, **kwargs):
+    """
+    Render many reStructuredText sources, parallelized over a pool of
+    processes.
+
+    Rendering is CPU bound, so processes are the way to use more than a single
+    core. Sources are sent to processes by chunks to limit the inter-process
+    communication overhead.
+
+    Args:
+        sources (iterable): reStructuredText sources to render.
+        **kwargs: Arbitrary keyword arguments to give as options to
+            ``RstBasicRenderer.get_options()``.
+
+    Keyword Arguments:
+        setting_key (string): Configuration name from registered
+            configurations.
+        workers (int): Number of processes to use. Default to ``None`` for the
+            number of CPUs. With a single worker (or a single source),
+            documents are rendered in the current process without any pool.
+        chunksize (int): Number of sources sent at once to a process. Default
+            to ``None`` to let ``multiprocessing`` compute it from the number
+            of sources and workers.
+        renderer_class (class): Renderer class to use. Default to
+            ``RstExtendedRenderer``.
+        body_only (bool): Returned content mode, see
+            ``RstBasicRenderer.parse()``.
+
+    Returns:
+        list: ``rstview.parser.RenderedDocument`` for every sources, in the
+        same order. Each one contains the rendered ``output`` and the
+        ``messages`` from renderer (always empty with ``RstBasicRenderer``).
+    """
+    sources = list(sources)
+    batch_options = {
+        'renderer_class': renderer_class or RstExtendedRenderer,
+        'setting_key': setting_key,
+        'body_only': body_only,
+        'options': kwargs,
+    }
+
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    workers = min(workers, len(sources))
+
+    if workers <= 1:
+        return [render_document(item, batch_options) for item in sources]
+
+    pool = multiprocessing.Pool(
+        processes=workers,
+        initializer=init_render_worker,
+        initargs=(dict(rstview_registry.get_registry()), batch_options)
+    )
+    try:
+        return pool.map(render_document, sources, chunksize)
+    finally:
+        # Every task is done (or failed) at this point
+        pool.terminate()
+        pool.join()
+
+
 def build_output(source, output_filepath, **kwargs):
     """
     Very basic shortcut helper to build a file from rendered reStructuredText
@@ -27,6 +27,11 @@ A configuration is a dictionnary of parameters for reStructuredText parser:
 
 Configuration name is used to retrieve parameters from the registry interface.
 
+Registry keeps a revision number which is increased on every change, so
+anything computed from configurations (like the resolved parser settings) can
+know when to be invalidated. If you change configuration parameters in place,
+you will have to call ``RstConfigSite.touch()`` yourself.
+
 See `Docutils Configuration`_ for a full references of available parser
 parameters.
 
@@ -51,12 +56,20 @@ class RstConfigSite(object):
     """
     def __init__(self, *args, **kwargs):
         self._registry = kwargs.get('initial', {})
+        self.revision = 0
+
+    def touch(self):
+        """
+        Increase registry revision to mark it as changed.
+        """
+        self.revision += 1
 
     def reset(self):
         """
         Reset registry to an empty Dict.
         """
         self._registry = {}
+        self.touch()
 
     def get_registry(self):
         """
@@ -118,6 +131,7 @@ class RstConfigSite(object):
             raise RstviewConfigAlreadyRegistered(msg.format(name))
 
         self._registry[name] = value
+        self.touch()
 
     def unregister(self, name):
         """
@@ -133,6 +147,7 @@ class RstConfigSite(object):
             msg = 'Given name "{}" is not registered as a configuration.'
             raise RstviewConfigNotRegistered(msg.format(name))
         del self._registry[name]
+        self.touch()
 
     def update(self, configs):
         """
@@ -144,6 +159,7 @@ class RstConfigSite(object):
             configs (dict): A dict of configurations.
         """
         self._registry.update(configs)
+        self.touch()
 
 
 #: Default rstview configurations registry for a Django instance.
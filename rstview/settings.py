@@ -48,3 +48,13 @@ RSTVIEW_PARSER_SECURITY = {
     'enable_exit': 0
 }
 
+#: Python path to the render cache backend class, ``None`` to disable render
+#: cache.
+RSTVIEW_RENDER_CACHE_BACKEND = None
+
+#: Keyword arguments given to the render cache backend.
+RSTVIEW_RENDER_CACHE_OPTIONS = {}
+
+#: Maximum count of parsed document trees to keep in memory, ``0`` to disable
+#: doctree cache.
+RSTVIEW_DOCTREE_CACHE_ENTRIES = 100
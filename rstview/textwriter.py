@@ -0,0 +1,26 @@
+"""
+Plain text writer
+=================
+
+A very basic **docutils** writer which only output the text content from
+document, mostly useful to feed a search index.
+"""
+from docutils import writers
+
+
+class PlainTextWriter(writers.Writer):
+    """
+    Writer to output the document text without any markup.
+
+    Like HTML writers, it fills a ``fragment`` part so it can be used with
+    renderer ``body_only`` mode.
+    """
+    supported = ('text',)
+
+    def translate(self):
+        self.output = self.document.astext()
+
+    def assemble_parts(self):
+        writers.Writer.assemble_parts(self)
+        self.parts['fragment'] = self.output
+        self.parts['body'] = self.output